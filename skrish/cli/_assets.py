@@ -0,0 +1,15 @@
+"""Contains static text assets used by the interface.
+"""
+
+
+TITLE = """
+    ▄████████    ▄█   ▄█▄    ▄████████  ▄█     ▄████████    ▄█    █▄    
+  ███    ███   ███ ▄███▀   ███    ███ ███    ███    ███   ███    ███   
+  ███    █▀    ███▐██▀     ███    ███ ███▌   ███    █▀    ███    ███   
+  ███         ▄█████▀     ▄███▄▄▄▄██▀ ███▌   ███         ▄███▄▄▄▄███▄▄ 
+▀███████████ ▀▀█████▄    ▀▀███▀▀▀▀▀   ███▌ ▀███████████ ▀▀███▀▀▀▀███▀  
+         ███   ███▐██▄   ▀███████████ ███           ███   ███    ███   
+   ▄█    ███   ███ ▀███▄   ███    ███ ███     ▄█    ███   ███    ███   
+ ▄████████▀    ███   ▀█▀   ███    ███ █▀    ▄████████▀    ███    █▀    
+               ▀           ███    ███                                  
+"""
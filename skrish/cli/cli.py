@@ -74,8 +74,11 @@ class Interface:
 
     def __enter__(self):
         """Called upon calling the interface using `with`.
+
+        Returns the underlying instance directly so every attribute access inside the block skips the
+        `__getattr__` forwarding hop.
         """
-        return self
+        return self.instance
 
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
         """Called upon exiting the scope of the interface using `with`.
@@ -5,7 +5,11 @@ import time
 from collections import Iterable
 from typing import Tuple, List, Callable, Any, Optional, Iterator, TypeVar, Generic, Dict, Union
 from skrish.cli.screen import Screen
-from skrish.cli.util import Anchor
+from skrish.cli.util import Anchor, encode_text, split_lines
+
+
+# Target frame rate for element animations
+_ANIMATION_FPS = 60
 
 
 class Element:
@@ -17,8 +21,6 @@ class Element:
     offset: Tuple[int, int]
     anchor: Anchor
 
-    __should_display: bool
-
     def __init__(self, screen: Screen, vertical: float, horizontal: float, *,
                  offset: Tuple[int, int] = (0, 0), anchor: Anchor = Anchor.CENTER_CENTER) -> None:
         """Initialize this element with basic attributes.
@@ -31,7 +33,6 @@ class Element:
         self.horizontal = horizontal
         self.offset = offset
         self.anchor = anchor
-        self.__should_display = True
 
     def set_position(self, *, vertical: float = None, horizontal: float = None,
                      offset: Tuple[int, int] = None, anchor: Anchor = None) -> None:
@@ -47,24 +48,32 @@ class Element:
         if anchor is not None:
             self.anchor = anchor
 
-    def set_screen(self, screen: Screen, display: bool = True) -> Screen:
+    def set_screen(self, screen: Screen, display: bool = True, flush: bool = True) -> Screen:
         """Set the <screen> that this element is attached to, and display it. If <display> is set to False,
-        the element will not be flagged for display."""
+        the element will not be flagged for display. The <flush> flag is forwarded to the display call so
+        batch callers can defer the terminal update."""
         past_screen = self._screen
         self._screen = screen
         if display:
-            self.display()
+            self.display(flush=flush)
         return past_screen
 
-    def display(self) -> None:
-        """Update and display this element on the set screen and refresh.
+    def display(self, flush: bool = True) -> None:
+        """Update and display this element on the set screen.
+
+        The element draws into the virtual screen via `noutrefresh`; if <flush> is set the physical terminal
+        is updated immediately with `curses.doupdate`. Batch callers pass <flush> as False and issue a single
+        `curses.doupdate` after drawing every element, so the terminal receives one diffed burst per frame
+        instead of one full update per element.
         """
         raise NotImplementedError
 
     def move(self, secs: float, *,
-             vertical: float = 0, horizontal: float = 0, skippable: bool = True) -> None:
+             vertical: float = 0, horizontal: float = 0, skippable: bool = True,
+             max_fps: int = _ANIMATION_FPS) -> None:
         """Move this element in <secs> seconds a delta of <vertical> and <horizontal> percentages of the screen.
-        If <skippable> is set, then the animation can be skipped.
+        If <skippable> is set, then the animation can be skipped, and the animation is paced to draw at most
+        <max_fps> frames per second.
         """
         # Watch for keys without delay
         if skippable:
@@ -72,19 +81,34 @@ class Element:
 
         start_vertical, start_horizontal = self.vertical, self.horizontal
 
+        # Track the last drawn cell so frames that do not move the element by at least one full cell are
+        # skipped entirely instead of redrawn in place.
+        y_max, x_max = self._screen.size()
+        last_cell = None
+
+        frame_budget = 1 / max_fps
+        delta_average = frame_budget
+
+        # Hoist the per-frame lookups out of the loop
+        getch = self._screen.stdscr.getch
+        perf_counter = time.perf_counter
+
         i = 0
-        last_time = time.time()
+        last_time = perf_counter()
         while i < 1:
-            # Check if any character was pressed to skip movement
-            if skippable and self._screen.stdscr.getch() > 0:
-                self._screen.clear()
-                i = 1
-            # .getch() refreshes the screen, so refresh only if required
-            if not skippable:
-                self._screen.stdscr.refresh()
+            # Check if any character was pressed to skip movement; a resize arrives as a key here too and
+            # must refresh the cached dimensions before they are used to position anything else
+            if skippable:
+                key = getch()
+                if key == curses.KEY_RESIZE:
+                    self._screen.invalidate_size()
+                    y_max, x_max = self._screen.size()
+                if key > 0:
+                    self._screen.erase()
+                    i = 1
 
             # Manage timing
-            cur_time = time.time()
+            cur_time = perf_counter()
             deltatime, last_time = cur_time - last_time, cur_time
             i += deltatime / secs
             if i > 1:
@@ -94,7 +118,30 @@ class Element:
             self.vertical = start_vertical + i * vertical
             self.horizontal = start_horizontal + i * horizontal
 
-            self.display()
+            # Track a moving average of the frame delta; an iteration that ran far over the recent average
+            # is lagging, so skip its draw and let interpolation catch the element up next frame. The
+            # multi-cell jump this produces is safe only because the blit path blanks the previously drawn
+            # rectangle before each frame
+            delta_average = 0.9 * delta_average + 0.1 * deltatime
+            lagging = deltatime > 1.5 * delta_average
+
+            # Sub-cell movement cannot change what is on screen, so only draw when the cell position moved
+            # (the final frame always draws)
+            cell = (int(self.vertical * y_max), int(self.horizontal * x_max))
+            if (cell != last_cell and not lagging) or i >= 1:
+                last_cell = cell
+
+                # Draw into the virtual screen and flush the frame to the terminal in one diffed update,
+                # wrapped in synchronized-output markers so the terminal composites the frame at once
+                self._screen.begin_synchronized()
+                self.display(flush=False)
+                curses.doupdate()
+                self._screen.end_synchronized()
+
+            # Sleep out the remainder of the frame budget rather than spinning at an uncapped rate
+            remaining = frame_budget - (perf_counter() - cur_time)
+            if remaining > 0:
+                curses.napms(int(remaining * 1000))
 
         # Stop watching for keys without delay
         if skippable:
@@ -135,11 +182,11 @@ class ElementContainer(Iterable, Generic[T]):
         return self._elements[identifier]
 
     def display(self) -> None:
-        """Display all updated elements set to be displayed. Elements are automatically set to be displayed after
-        being updated unless otherwise flagged.
+        """Display all elements in the container, flushing the terminal once for the whole batch.
         """
         for element in self._elements.values():
-            element.display()
+            element.display(flush=False)
+        curses.doupdate()
 
 
 class BasicTextElement(Element):
@@ -150,73 +197,151 @@ class BasicTextElement(Element):
 
     def __init__(self, screen: Screen, vertical: float, horizontal: float, text: str, *,
                  offset: Tuple[int, int] = (0, 0), anchor: Anchor = Anchor.CENTER_CENTER,
-                 style: int = curses.A_NORMAL) -> None:
+                 style: int = curses.A_NORMAL, static: bool = False) -> None:
         """Initialize this basic text element with basic attributes and text attributes.
 
-        Text attributes are the <text> to be displayed in a <style>.
+        Text attributes are the <text> to be displayed in a <style>. Elements marked <static> (e.g. large
+        title art whose text never changes) are drawn into an off-screen pad once and re-shown with a single
+        blit per display instead of one draw call per line.
         """
         super().__init__(screen, vertical, horizontal, offset=offset, anchor=anchor)
         self.text = text
         self.style = style
 
-    def display(self) -> None:
-        # Split the text up and strip any unneeded whitespace
-        text_list = self.text.strip("\n").split("\n")
+        self.__static = static
+        self.__pad = None
+        self.__pad_size = None
+        self.__pad_text = None
+        self.__pad_rect = None
 
-        y_max, x_max = self._screen.stdscr.getmaxyx()
-        y, x = self._screen.position_message(text_list, self.anchor, self.vertical, self.horizontal)
+    def display(self, flush: bool = True) -> None:
+        # Empty text draws nothing, so skip the split, positioning, and clipping work entirely
+        if not self.text:
+            return
 
-        # FIXME: moving out of bottom-right corner crashes
-        # Cut off vertical out-of-bounds lines of the text
-        num_lines = len(text_list)
-        if y + self.offset[0] < 0:
-            text_list = text_list[-(y + self.offset[0]):]
-            y = self.offset[0]
-        if y + self.offset[0] + num_lines > y_max:
-            if y + self.offset[0] > y_max:
-                y = y_max - self.offset[0]
-            text_list = text_list[:y_max - (y + self.offset[0])]
-
-        # Cut off line out-of-bounds beginnings or ends
+        # Static elements draw into their pad once (rebuilt only if the text is ever swapped out) and are
+        # re-shown from it on every display after that
+        if self.__static and self.__pad_text != self.text:
+            text_list = split_lines(self.text)
+            self.__pad = self._screen.make_pad(text_list, self.style)
+            self.__pad_size = (len(text_list), max(len(line) for line in text_list))
+            self.__pad_text = self.text
+
+        # A move in progress or a static element renders from its prebuilt pad: blit the visible rectangle
+        # in a single curses call instead of one addstr per line, letting the diff algorithm emit only the
+        # cells that changed
+        if self.__pad is not None:
+            num_lines, max_line = self.__pad_size
+            y_max, x_max = self._screen.size()
+            y, x = self._screen.position_lines((), self.anchor, self.vertical, self.horizontal,
+                                               size=self.__pad_size)
+            base_y, base_x = y + self.offset[0], x + self.offset[1]
+
+            # Clamp the destination rectangle to the screen; curses errors on out-of-bounds corners
+            top, left = max(0, base_y), max(0, base_x)
+            bottom = min(y_max - 1, base_y + num_lines - 1)
+            right = min(x_max - 1, base_x + max_line - 1)
+            rect = (top, left, bottom, right) if top <= bottom and left <= right else None
+
+            # A frame can advance farther than the pad's blank border covers (fast sweeps on wide
+            # terminals, a lag-skipped frame), so blank whatever the previous blit covered before drawing
+            last_rect = self.__pad_rect
+            if last_rect is not None and last_rect != rect:
+                blank = " " * (last_rect[3] - last_rect[1] + 1)
+                addstr = self._screen.stdscr.addstr
+                for row in range(last_rect[0], last_rect[2] + 1):
+                    addstr(row, last_rect[1], blank)
+                self._screen.stdscr.noutrefresh()
+            self.__pad_rect = rect
+
+            # Fully off-screen pads draw nothing beyond the blanking above
+            if rect is None:
+                if flush:
+                    curses.doupdate()
+                return
+
+            self.__pad.noutrefresh(top - base_y, left - base_x, top, left, bottom, right)
+            if flush:
+                curses.doupdate()
+            return
+
+        # Split the text up and strip any unneeded whitespace; the split is memoized since the same text is
+        # redrawn frame after frame
+        text_list = split_lines(self.text)
+
+        # Measure the block once up-front; positioning and clipping below both need it
         max_line = max(len(line) for line in text_list)
-        if x + self.offset[1] < 0:
-            text_list = [line[-(x + self.offset[1]):] for line in text_list]
-            x = self.offset[1]
-        if x + self.offset[1] + max_line > x_max:
-            if x + self.offset[1] > x_max:
-                x = x_max - self.offset[1]
-            text_list = [line[:x_max - (x + self.offset[1])] for line in text_list]
-
-        # Display every line that needs to be displayed in its correct location
+
+        y_max, x_max = self._screen.size()
+        y, x = self._screen.position_lines(text_list, self.anchor, self.vertical, self.horizontal,
+                                           size=(len(text_list), max_line))
+
+        # FIXME: moving out of bottom-right corner crashes
+        # Clip to the visible region by index bounds instead of building sliced copies of every line
+        base_y, base_x = y + self.offset[0], x + self.offset[1]
+        y_start, y_end = max(0, -base_y), min(len(text_list), y_max - base_y)
+        x_start, x_end = max(0, -base_x), min(max_line, x_max - base_x)
+
+        # Fully off-screen text draws nothing at all
+        if y_start >= y_end or x_start >= x_end:
+            self._screen.stdscr.noutrefresh()
+            if flush:
+                curses.doupdate()
+            return
+
+        # Display every visible line in its correct location, slicing only the lines that actually clip;
+        # position_lines always resolves concrete coordinates, so the cursor is never queried. Lines are
+        # passed to curses pre-encoded so repeated draws of the same text skip the per-call re-encoding.
+        draw_y, draw_x = base_y + y_start, base_x + x_start
+        addstr, style = self._screen.stdscr.addstr, self.style
+        encoding = self._screen.stdscr.encoding
         counter = 0
-        for line in text_list:
+        for k in range(y_start, y_end):
+            line = text_list[k]
             if not line:
                 continue
 
-            cursor_y, cursor_x = self._screen.stdscr.getyx()
-            self._screen.stdscr.addstr((y if y is not None else cursor_y) + counter + self.offset[0],
-                                       (x if x is not None else cursor_x) + self.offset[1],
-                                       line, self.style)
+            if x_start > 0 or x_end < len(line):
+                line = line[x_start:x_end]
+            addstr(draw_y + counter, draw_x, encode_text(line, encoding), style)
             counter += 1
 
-        self._screen.stdscr.refresh()
-
-    def move(self, *args, **kwargs) -> None:
-        # Pad the message with spaces to not need to clear after every step of movement
-        text_list = self.text.strip("\n").split("\n")
-        h_padding, v_padding = " ", (" " * max(len(line) for line in text_list) if text_list else 0)
-        text_list = [(h_padding + line + h_padding) for line in text_list]
-        self.text = (v_padding + "\n") + ("\n".join(text_list)) + ("\n" + v_padding)
-
-        super().move(*args, **kwargs)
+        self._screen.stdscr.noutrefresh()
+        if flush:
+            curses.doupdate()
 
-        # Removing the padding added before
-        text_list = self.text.strip("\n").split("\n")
-        text_list = [line[1:-1] for line in text_list[1:-1]]
-        self.text = "\n".join(text_list)
+    def move(self, *args, vertical: float = 0, horizontal: float = 0, **kwargs) -> None:
+        # Moving empty text draws nothing, so jump straight to the destination
+        if not self.text:
+            self.vertical += vertical
+            self.horizontal += horizontal
+            return
 
-    def _clear(self, length: int, height: int = 1) -> None:
-        """Clear this element with whitespace of length <length> and height <height>.
+        # Draw the text into an off-screen pad exactly once for the whole animation, bordered with a ring of
+        # spaces so each frame's blit also erases the trail of the previous one; every frame then costs a
+        # single pad blit while display renders from the pad
+        text_list = split_lines(self.text)
+        max_line = max(len(line) for line in text_list) if text_list else 0
+        v_padding = " " * (max_line + 2)
+        padded = (v_padding,) + tuple(" " + line + " " for line in text_list) + (v_padding,)
+        self.__pad = self._screen.make_pad(padded, self.style)
+        self.__pad_size = (len(padded), max_line + 2)
+
+        # Mark the pad as current for this text so a static element's display does not rebuild its
+        # unpadded pad mid-animation and lose the erasing border
+        self.__pad_text = self.text
+
+        try:
+            super().move(*args, vertical=vertical, horizontal=horizontal, **kwargs)
+        finally:
+            self.__pad = None
+            self.__pad_size = None
+            self.__pad_text = None
+            self.__pad_rect = None
+
+    def _clear(self, length: int, height: int = 1, flush: bool = True) -> None:
+        """Clear this element with whitespace of length <length> and height <height>. The <flush> flag is
+        forwarded to the display call so callers about to redraw can defer the terminal update.
         """
         # Set the text to whitespace
         past_text = self.text
@@ -224,9 +349,9 @@ class BasicTextElement(Element):
 
         # Make sure we use the regular display function rather than whatever the subclasses function is
         if type(self) is not BasicTextElement:
-            super(type(self), self).display()
+            super(type(self), self).display(flush=flush)
         else:
-            self.display()
+            self.display(flush=flush)
 
         # Revert the text
         self.text = past_text
@@ -271,6 +396,12 @@ class SpinnerElement(BasicTextElement):
         self.max_value = max_value
         self.label_gap = label_gap
 
+        # The value bounds and edge pairs are fixed after construction, so resolve the formatting widths
+        # once here instead of per redraw; the edge swap on selection cannot change the maximum
+        self.__max_digits = max(len(str(self.max_value)), len(str(self.min_value)))
+        self.__max_edges = max(len(str(self.edges[0] + self.edges[1])),
+                               len(str(self.selected_edges[0] + self.selected_edges[1])))
+
         # Only create a valid label element if the label has been set
         if label:
             self.label_element = BasicTextElement(screen, self.horizontal, self.vertical, label,
@@ -284,9 +415,13 @@ class SpinnerElement(BasicTextElement):
         if step is None:
             step = self.step_value
 
-        # Update the value, text, and display
+        # Update the value, text, and display; a value already clamped at the boundary changes nothing
+        # on screen, so skip the redraw entirely
+        past_value = self.value
         self.value += step
         self.value = min(self.value, self.max_value if self.max_value is not None else self.value)
+        if self.value == past_value:
+            return
         self.text = str(self.value)
         self.display()
 
@@ -296,16 +431,18 @@ class SpinnerElement(BasicTextElement):
         if step is None:
             step = self.step_value
 
-        # Update the value, text, and display
+        # Update the value, text, and display; a value already clamped at the boundary changes nothing
+        # on screen, so skip the redraw entirely
+        past_value = self.value
         self.value -= step
         self.value = max(self.value, self.min_value if self.min_value is not None else self.value)
+        if self.value == past_value:
+            return
         self.text = str(self.value)
         self.display()
 
-    def display(self) -> None:
-        max_digits = max(len(str(self.max_value)), len(str(self.min_value)))
-        max_edges = max(len(str(self.edges[0] + self.edges[1])),
-                        len(str(self.selected_edges[0] + self.selected_edges[1])))
+    def display(self, flush: bool = True) -> None:
+        max_digits, max_edges = self.__max_digits, self.__max_edges
 
         # Apply the edges before displaying
         self.text = self.edges[0] + self.text.center(max_digits) + self.edges[1]
@@ -313,15 +450,15 @@ class SpinnerElement(BasicTextElement):
         # Display the label if required, pushing the spinner to the side
         if self.label_element:
             self.horizontal += self.label_gap
-            self._clear(max_digits + max_edges)
-            super().display()
+            self._clear(max_digits + max_edges, flush=False)
+            super().display(flush=False)
             self.horizontal -= self.label_gap
 
             self.label_element.set_position(vertical=self.vertical, horizontal=self.horizontal, offset=self.offset)
-            self.label_element.display()
+            self.label_element.display(flush=flush)
         else:
-            self._clear(max_digits + max_edges)
-            super().display()
+            self._clear(max_digits + max_edges, flush=False)
+            super().display(flush=flush)
 
         # Remove the edges from the text
         self.text = self.text[1:-1]
@@ -388,38 +525,102 @@ class MenuListElement(Element):
         self.edges = edges
         self.selected_style = selected_style
 
+        # Both redraw styles are constant for the menu's lifetime, so resolve the normal one here too
+        self.__normal_style = curses.A_NORMAL
+
         self.selection = initial_selection
 
-    def display(self) -> None:
-        width = max(self.min_width, max(len(element.text) for element in self.__elements))
-        for i, element in enumerate(self.__elements):
-            # If the element is text and does not have the required edges, apply them
-            if isinstance(element, BasicTextElement) and len(element.text) > 0:
-                if not (element.text[0] == self.edges[0] and element.text[-1] == self.edges[1]):
-                    element.text = self.edges[0] + element.text.center(width) + self.edges[1]
-
-            # Display the element in the correct positioning
-            element.style = self.selected_style if self.selection == i else curses.A_NORMAL
-            element.set_position(vertical=self.vertical,
-                                 horizontal=self.horizontal,
-                                 offset=(self.offset[0] + i * self.spacing, self.offset[1]),
-                                 anchor=self.anchor)
-            element.set_screen(self._screen)
-        self._screen.stdscr.refresh()
+        self.__offsets = None
+        self.__offsets_key = None
+        self.__width = None
+
+        # Static text options never change, so frame them with the edges once up front; dynamic elements
+        # (e.g. spinners) keep being framed at display time since their text varies
+        width = self.__get_width()
+        for element in self.__elements:
+            if type(element) is BasicTextElement and len(element.text) > 0:
+                element.text = self.edges[0] + element.text.center(width) + self.edges[1]
+        self.__width = None
+
+    def display(self, flush: bool = True) -> None:
+        width = self.__get_width()
+
+        # Resolve the two possible styles once instead of per option
+        selected_style, normal_style = self.selected_style, self.__normal_style
+        for i in range(len(self.options)):
+            self.__display_option(i, width, selected_style if i == self.selection else normal_style)
+        self._screen.stdscr.noutrefresh()
+        if flush:
+            curses.doupdate()
+
+    def __display_option(self, i: int, width: int, style: int) -> None:
+        """Display the single option at index <i> framed to the given <width> with the given <style> in its
+        correct positioning.
+        """
+        element = self.__elements.get_element(str(i))
+
+        # If the element is text and does not have the required edges, apply them; the text mutation
+        # invalidates the cached framing width
+        if isinstance(element, BasicTextElement) and len(element.text) > 0:
+            if not (element.text[0] == self.edges[0] and element.text[-1] == self.edges[1]):
+                element.text = self.edges[0] + element.text.center(width) + self.edges[1]
+                self.__width = None
+
+        # Display the element in the correct positioning
+        element.style = style
+        element.set_position(vertical=self.vertical,
+                             horizontal=self.horizontal,
+                             offset=self.__get_option_offsets()[i],
+                             anchor=self.anchor)
+        element.set_screen(self._screen, flush=False)
+
+    def __get_option_offsets(self) -> List[Tuple[int, int]]:
+        """Return the per-option display offsets, rebuilding them only when the base offset or spacing has
+        changed since they were last computed.
+        """
+        key = (self.offset, self.spacing)
+        if self.__offsets_key != key:
+            self.__offsets = [(self.offset[0] + i * self.spacing, self.offset[1])
+                              for i in range(len(self.options))]
+            self.__offsets_key = key
+        return self.__offsets
+
+    def __get_width(self) -> int:
+        """Return the framing width of this menu's options.
+
+        The width only changes when an option's text does, so it is cached and recomputed lazily after any
+        framing mutation instead of rescanned on every redraw.
+        """
+        if self.__width is None:
+            self.__width = max(self.min_width, max(len(element.text) for element in self.__elements))
+        return self.__width
 
     def up(self) -> None:
         """Go up in the list.
         """
-        self.selection -= 1
-        self.selection %= len(self.options)
-        self.display()
+        self.move_selection(-1)
 
     def down(self) -> None:
         """Go down in the list.
         """
-        self.selection += 1
-        self.selection %= len(self.options)
-        self.display()
+        self.move_selection(1)
+
+    def move_selection(self, delta: int) -> None:
+        """Move the selection by <delta> entries, wrapping around the list.
+
+        Only the rows whose style actually changed are repainted; every other option is untouched on screen.
+        """
+        previous = self.selection
+        self.selection = (self.selection + delta) % len(self.options)
+        if previous == self.selection:
+            return
+
+        width = self.__get_width()
+        if previous >= 0:
+            self.__display_option(previous, width, self.__normal_style)
+        self.__display_option(self.selection, width, self.selected_style)
+        self._screen.stdscr.noutrefresh()
+        curses.doupdate()
 
     def select(self) -> Optional[Callable[[], Any]]:
         """Select the currently highlighted option.
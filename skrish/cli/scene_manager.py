@@ -77,9 +77,10 @@ class SceneManager:
 
         Raises a `NoSuchSceneException` if there does not exist a scene with the given identifier.
         """
-        if identifier not in SceneManager.__scenes:
+        try:
+            return SceneManager.__scenes[identifier]
+        except KeyError:
             raise NoSuchSceneException("This scene does not exist.")
-        return SceneManager.__scenes[identifier]
 
     @staticmethod
     def get_scene_identifiers() -> Iterable[str]:
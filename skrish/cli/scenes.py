@@ -3,30 +3,16 @@
 import curses
 from typing import Callable, Tuple, Optional
 
+from skrish.cli._assets import TITLE
 from skrish.cli.elements import BasicTextElement, MenuListElement, SpinnerElement
 from skrish.cli.util import Anchor, ColorPair
 from skrish.cli.scene_manager import Scene, SceneControl, SceneManager
 from skrish.cli.cli import Interface
 from skrish.cli.screen import Screen
 
-from skrish.game.game import Game
-
-
-TITLE = """
-    ▄████████    ▄█   ▄█▄    ▄████████  ▄█     ▄████████    ▄█    █▄    
-  ███    ███   ███ ▄███▀   ███    ███ ███    ███    ███   ███    ███   
-  ███    █▀    ███▐██▀     ███    ███ ███▌   ███    █▀    ███    ███   
-  ███         ▄█████▀     ▄███▄▄▄▄██▀ ███▌   ███         ▄███▄▄▄▄███▄▄ 
-▀███████████ ▀▀█████▄    ▀▀███▀▀▀▀▀   ███▌ ▀███████████ ▀▀███▀▀▀▀███▀  
-         ███   ███▐██▄   ▀███████████ ███           ███   ███    ███   
-   ▄█    ███   ███ ▀███▄   ███    ███ ███     ▄█    ███   ███    ███   
- ▄████████▀    ███   ▀█▀   ███    ███ █▀    ▄████████▀    ███    █▀    
-               ▀           ███    ███                                  
-"""
 
 interface = Interface.instance
 screen: Screen = interface.screen
-game: Game = interface.game
 
 register_scene = SceneManager.register_scene
 get_scene = SceneManager.get_scene
@@ -39,7 +25,7 @@ class IntroScene(Scene):
         super().__init__()
 
     def display(self) -> Tuple[Optional[Scene], SceneControl]:
-        screen.clear()
+        screen.erase()
 
         intro = BasicTextElement(screen, 0.3, -0.2, TITLE, style=ColorPair.TITLE.pair)
         intro.move(1, horizontal=0.7, skippable=True)
@@ -62,11 +48,11 @@ class MainMenuScene(Scene):
         ], min_width=25, selected_style=curses.A_STANDOUT | curses.A_BOLD)
         self.element_container.add_element("menu", self.menu)
 
-        self.title = BasicTextElement(screen, 0.3, 0.5, TITLE, style=ColorPair.TITLE.pair)
+        self.title = BasicTextElement(screen, 0.3, 0.5, TITLE, style=ColorPair.TITLE.pair, static=True)
         self.element_container.add_element("title", self.title)
 
     def display(self) -> Tuple[Optional[Scene], SceneControl]:
-        screen.clear()
+        screen.erase()
 
         self.element_container.display()
 
@@ -97,7 +83,7 @@ class OptionsScene(Scene):
         self.element_container["title"] = BasicTextElement(screen, 0.25, 0.5, "=== OPTIONS ===", style=curses.A_BOLD)
 
     def display(self) -> Tuple[Optional[Scene], SceneControl]:
-        screen.clear()
+        screen.erase()
 
         self.element_container.display()
 
@@ -111,7 +97,7 @@ class CreditsScene(Scene):
         self.element_container["title"] = BasicTextElement(screen, 0.25, 0.5, "=== CREDITS ===", style=curses.A_BOLD)
 
     def display(self) -> Tuple[Optional[Scene], SceneControl]:
-        screen.clear()
+        screen.erase()
 
         self.element_container.display()
 
@@ -160,7 +146,7 @@ class CharacterCreationScene(Scene):
                              anchor=Anchor.TOP_LEFT, offset=(0, 2), style=curses.A_BOLD)
 
     def display(self) -> Tuple[Optional[Scene], SceneControl]:
-        screen.clear()
+        screen.erase()
 
         self.character.box()
         self.info.box()
@@ -205,7 +191,7 @@ def _scene_goto(identifier: str, remove_history: bool = False) -> Tuple[Scene, S
     elif identifier == "EXIT":
         control = SceneControl.GOTO
     else:
-        scene = SceneManager.get_scene(identifier)()
+        scene = get_scene(identifier)()
         control = SceneControl.GOTO
 
     if remove_history:
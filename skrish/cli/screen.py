@@ -1,8 +1,16 @@
 """Manages a screen wrapper class around the default curses window.
 """
-from typing import Tuple, List, Union, Callable, Any
+import curses
+import sys
+from typing import Dict, Tuple, List, Union, Callable, Any, Sequence
 
-from skrish.cli.util import Anchor
+from skrish.cli.util import Anchor, measure
+
+
+# Synchronized-output control sequences (DECSET 2026): terminals that support them hold everything written
+# between the two markers and composite it as a single frame, while other terminals ignore them entirely.
+_SYNC_BEGIN = "\x1b[?2026h"
+_SYNC_END = "\x1b[?2026l"
 
 
 class Screen:
@@ -13,16 +21,35 @@ class Screen:
         """Initialize this screen with the given ncurses window.
         """
         self.stdscr = stdscr
+        self.__position_cache: Dict[Tuple, Tuple[int, int]] = {}
+        self.__size: Tuple[int, int] = None
+
+    def __getattr__(self, name: str) -> Any:
+        """Forward any attribute not defined on this wrapper (e.g. `clear`, `box`) to the underlying
+        curses window.
+        """
+        return getattr(self.stdscr, name)
+
+    def size(self) -> Tuple[int, int]:
+        """Return the (y, x) size of this screen, querying curses only when the cached value is invalid.
 
-        # Forward basic functionality
-        self.clear = self.stdscr.clear
-        self.box = self.stdscr.box
+        The size of a window only changes when the terminal is resized, so render-path callers read this
+        instead of calling `getmaxyx` per draw; `invalidate_size` drops the cache when a resize is observed.
+        """
+        if self.__size is None:
+            self.__size = self.stdscr.getmaxyx()
+        return self.__size
+
+    def invalidate_size(self) -> None:
+        """Invalidate the cached screen size, forcing the next `size` call to re-query curses.
+        """
+        self.__size = None
 
     def grid_screen(self, dimensions_list: List[Tuple[float, float, float, float]]) -> List['Screen']:
         """Generates a grid of sub-screens based off the given <dimensions_list>, and returns the list of created
         sub-screens.
         """
-        y_max, x_max = self.stdscr.getmaxyx()
+        y_max, x_max = self.size()
         screens = []
         for dimensions in dimensions_list:
             y_size, x_size = y_max * dimensions[0], x_max * dimensions[1]
@@ -46,26 +73,27 @@ class Screen:
                  anchor: Anchor = Anchor.CENTER_CENTER) -> 'Screen':
         """Generates a dialogue box sub-screen based off the given <dimensions>, and returns the sub-screen.
         """
-        y_max, x_max = self.stdscr.getmaxyx()
+        y_max, x_max = self.size()
         y_size, x_size = y_max * vertical_size, x_max * horizontal_size
         y_anchor_offset, x_anchor_offset = anchor.offset(y_size, x_size)
         y_offset, x_offset = y_max * vertical_offset + y_anchor_offset, x_max * horizontal_offset + x_anchor_offset
 
-        # Counteract truncating off the edge, cannot round because it is inconsistent (even-odd).
-        if y_size + y_offset == y_max:
-            if int(y_size) < y_size:
-                y_size += 1
-        if x_size + x_offset == x_max:
-            if int(x_size) < x_size:
-                x_size += 1
+        # Convert to integer cells exactly once and apply the truncation fixup on the integer values,
+        # cannot round because it is inconsistent (even-odd).
+        y_size_i, x_size_i, y_offset_i, x_offset_i = int(y_size), int(x_size), int(y_offset), int(x_offset)
+        if y_size + y_offset == y_max and y_size_i < y_size:
+            y_size_i += 1
+        if x_size + x_offset == x_max and x_size_i < x_size:
+            x_size_i += 1
 
         screen = Screen(self.stdscr.derwin(
-            int(y_size), int(x_size), int(y_offset), int(x_offset)
+            y_size_i, x_size_i, y_offset_i, x_offset_i
         ))
 
         screen.clear()
         screen.box()
-        screen.stdscr.refresh()
+        screen.stdscr.noutrefresh()
+        curses.doupdate()
 
         return screen
 
@@ -96,39 +124,127 @@ class Screen:
         #     text = joiner.join(text_array)
         #     self.put(text, vertical, horizontal, anchor=anchor, offset=offset)
 
+        # Index the options by keycode once so each poll is a single dict lookup instead of a scan over
+        # every option's keycode list
+        dispatch = {keycode: option for option in options for keycode in option[1]}
+
+        # Hoist the per-poll lookups out of the loop
+        getch = listener_screen.stdscr.getch
+        get_option = dispatch.get
+        napms = curses.napms
+        resize_key = curses.KEY_RESIZE
+
         listener_screen.stdscr.nodelay(True)
         while True:
-            key = listener_screen.stdscr.getch()
+            key = getch()
+            if key == resize_key:
+                self.invalidate_size()
+                listener_screen.invalidate_size()
             callback(key)
 
-            for option in options:
-                if key in option[1]:
-                    listener_screen.stdscr.nodelay(False)
-                    call = option[3]
-                    if option[4]:
-                        return call
+            # No key is pending on the vast majority of polls; sleep briefly instead of spinning a core
+            # at full speed between keystrokes
+            if key == -1:
+                napms(8)
+                continue
+
+            option = get_option(key)
+            if option is not None:
+                listener_screen.stdscr.nodelay(False)
+                call = option[3]
+                if option[4]:
+                    return call
+
+                call = call()
+                if call is not None:
+                    return call
+
+    @staticmethod
+    def begin_synchronized() -> None:
+        """Mark the start of a synchronized terminal update for a frame of drawing.
+
+        Everything written until `end_synchronized` is composited by supporting terminals as one frame,
+        eliminating mid-frame tearing during animations; unsupported terminals ignore the marker.
+        """
+        if sys.stdout.isatty():
+            sys.stdout.write(_SYNC_BEGIN)
+            sys.stdout.flush()
+
+    @staticmethod
+    def end_synchronized() -> None:
+        """Mark the end of a synchronized terminal update started with `begin_synchronized`.
+        """
+        if sys.stdout.isatty():
+            sys.stdout.write(_SYNC_END)
+            sys.stdout.flush()
 
-                    call = call()
-                    if call is not None:
-                        return call
+    def make_pad(self, lines: Sequence[str], style: int = curses.A_NORMAL) -> Any:
+        """Create an off-screen curses pad containing the given pre-split <lines> drawn with <style>.
+
+        The lines are written into the pad exactly once; callers can then blit any region of it per frame
+        with `pad.noutrefresh(...)` followed by `curses.doupdate()`, so moving or re-showing static art costs
+        a single curses call instead of one `addstr` per line.
+        """
+        height = len(lines)
+        width = max(len(line) for line in lines) if lines else 0
+        pad = curses.newpad(height + 1, width + 1)
+        for i, line in enumerate(lines):
+            pad.addstr(i, 0, line, style)
+        return pad
 
     def absolute_to_scale(self, y: int, x: int) -> Tuple[float, float]:
         """Convert from the absolute <y> and <x> relative to this screen to a scale percentage of the screen.
         """
-        y_max, x_max = self.stdscr.getmaxyx()
+        y_max, x_max = self.size()
         return y / y_max, x / x_max
 
     def position_message(self, message: Union[List[str], str], anchor: Anchor,
-                         vertical: float, horizontal: float) -> Tuple[int, int]:
+                         vertical: float, horizontal: float,
+                         size: Tuple[int, int] = None) -> Tuple[int, int]:
         """Return the y and x parameters required to position the given <message_list> at the given <y> and <x>
-        percentages of the screen with the given <anchor>.
+        percentages of the screen with the given <anchor>. The optional <size> carries a precomputed
+        (number of lines, longest line length) for pre-split messages whose caller already measured them.
         """
-        if isinstance(message, str):
-            message = message.strip("\n").split("\n")
-
-        y_max, x_max = self.stdscr.getmaxyx()
-        y_offset, x_offset = anchor.offset(len(message), max(len(line) for line in message))
+        y_max, x_max = self.size()
 
-        y = int(vertical * y_max + y_offset)
-        x = int(horizontal * x_max + x_offset)
-        return y, x
+        if isinstance(message, str):
+            # The same scene strings are positioned identically frame after frame, so memoize the result
+            # keyed by everything it depends on (including terminal size, which invalidates it on resize).
+            key = (message, anchor, vertical, horizontal, y_max, x_max)
+            position = self.__position_cache.get(key)
+            if position is not None:
+                return position
+
+            # Fast path for the overwhelmingly common case of a single-line message (e.g. menu options): no
+            # splitting, no list allocation, and no scan for the longest line.
+            if "\n" not in message:
+                y_offset, x_offset = anchor.offset(1, len(message))
+            else:
+                y_offset, x_offset = anchor.offset(*measure(message))
+
+            position = (int(vertical * y_max + y_offset), int(horizontal * x_max + x_offset))
+
+            # Animated elements sweep through fractional positions, so bound the cache instead of letting
+            # interpolated keys accumulate forever.
+            if len(self.__position_cache) > 512:
+                self.__position_cache.clear()
+            self.__position_cache[key] = position
+            return position
+
+        return self.position_lines(message, anchor, vertical, horizontal, size=size)
+
+    def position_lines(self, lines: Sequence[str], anchor: Anchor,
+                       vertical: float, horizontal: float,
+                       size: Tuple[int, int] = None) -> Tuple[int, int]:
+        """Return the y and x parameters required to position the given pre-split <lines> at the given
+        <vertical> and <horizontal> percentages of the screen with the given <anchor>.
+
+        This is the fast path behind `position_message` for callers that already hold the split lines: no
+        type dispatch, no stripping, and no splitting. Callers that have already measured the block pass
+        <size> as (number of lines, longest line length) to also skip the rescan for the longest line.
+        """
+        y_max, x_max = self.size()
+        if size is None:
+            size = (len(lines), max(len(line) for line in lines))
+        y_offset, x_offset = anchor.offset(*size)
+        return int(vertical * y_max + y_offset), int(horizontal * x_max + x_offset)
@@ -1,11 +1,58 @@
 """Provides useful CLI utilities for more efficient displaying of information.
 """
-from typing import Any, Tuple
+import functools
+from typing import Any, Dict, Tuple
 from enum import Enum
 
 import curses
 
 
+@functools.lru_cache(maxsize=128)
+def split_lines(message: str) -> Tuple[str, ...]:
+    """Return the lines of the given <message> stripped of surrounding newlines.
+
+    Redraw and animation loops split the same message strings frame after frame, so the result is memoized;
+    the returned tuple is shared and must not be mutated.
+    """
+    return tuple(message.strip("\n").split("\n"))
+
+
+@functools.lru_cache(maxsize=512)
+def encode_text(text: str, encoding: str) -> bytes:
+    """Return the given <text> encoded with <encoding>.
+
+    curses re-encodes every string it is handed; draw paths that emit the same strings frame after frame
+    pass pre-encoded bytes instead, and this keeps one encoded copy per distinct string.
+    """
+    return text.encode(encoding)
+
+
+@functools.lru_cache(maxsize=256)
+def measure(message: str) -> Tuple[int, int]:
+    """Return the (number of lines, longest line length) metrics of the given <message>.
+
+    The same labels are measured over and over while positioning, so repeat calls for a message are a single
+    cache lookup. A cache miss scans the string in one pass with `str.find` rather than materializing a list
+    of line copies just to take their lengths.
+    """
+    message = message.strip("\n")
+    length = len(message)
+    find = message.find
+
+    lines = 0
+    max_line = 0
+    start = 0
+    while start <= length:
+        end = find("\n", start)
+        if end == -1:
+            end = length
+        if end - start > max_line:
+            max_line = end - start
+        lines += 1
+        start = end + 1
+    return lines, max_line
+
+
 class ColorPair(Enum):
     STANDARD = 1
     SUCCESS = 2
@@ -17,20 +64,44 @@ class ColorPair(Enum):
 
     @classmethod
     def init_color_pairs(cls) -> None:
-        """Initialize color pairs.
+        """Eagerly register every color pair with curses.
+
+        Pairs normally register themselves lazily on first use; this warms them all up front for callers
+        that want the work out of the render path, and repeat calls are no-ops.
         """
-        curses.init_pair(ColorPair.STANDARD.value, curses.COLOR_WHITE, curses.COLOR_BLACK)
-        curses.init_pair(ColorPair.SUCCESS.value, curses.COLOR_GREEN, curses.COLOR_BLACK)
-        curses.init_pair(ColorPair.WARNING.value, curses.COLOR_YELLOW, curses.COLOR_BLACK)
-        curses.init_pair(ColorPair.ERROR.value, curses.COLOR_RED, curses.COLOR_BLACK)
-        curses.init_pair(ColorPair.TITLE.value, curses.COLOR_RED, curses.COLOR_BLACK)
-        curses.init_pair(ColorPair.SELECTED.value, curses.COLOR_WHITE, curses.COLOR_BLUE)
+        for member in cls:
+            _ = member.pair
 
     @property
     def pair(self) -> Any:
-        """Return the color pair represented by the item.
+        """Return the color pair represented by the item, registering and resolving it with curses on
+        first use. On a terminal without color support every pair resolves to the default attribute, so
+        callers never need to guard color usage themselves.
         """
-        return curses.color_pair(self.value)
+        resolved = _RESOLVED.get(self.value)
+        if resolved is None:
+            if curses.has_colors():
+                curses.init_pair(self.value, *_COLOR_DEFINITIONS[self])
+                resolved = curses.color_pair(self.value)
+            else:
+                resolved = 0
+            _RESOLVED[self.value] = resolved
+        return resolved
+
+
+# Resolved pair attribute per registered pair slot; kept at module scope because any non-descriptor
+# assignment in the Enum body is turned into a member
+_RESOLVED: Dict[int, int] = {}
+
+# Foreground and background colors backing each pair slot; registration with curses happens lazily per pair
+_COLOR_DEFINITIONS = {
+    ColorPair.STANDARD: (curses.COLOR_WHITE, curses.COLOR_BLACK),
+    ColorPair.SUCCESS: (curses.COLOR_GREEN, curses.COLOR_BLACK),
+    ColorPair.WARNING: (curses.COLOR_YELLOW, curses.COLOR_BLACK),
+    ColorPair.ERROR: (curses.COLOR_RED, curses.COLOR_BLACK),
+    ColorPair.TITLE: (curses.COLOR_RED, curses.COLOR_BLACK),
+    ColorPair.SELECTED: (curses.COLOR_WHITE, curses.COLOR_BLUE),
+}
 
 
 class Anchor(Enum):
@@ -44,10 +115,20 @@ class Anchor(Enum):
     BOTTOM_CENTER = (2, 1)
     BOTTOM_RIGHT = (2, 2)
 
+    def __init__(self, y_mult: int, x_mult: int) -> None:
+        """Unpack the anchor's positioning multipliers once at member creation.
+        """
+        self.__y_mult = y_mult
+        self.__x_mult = x_mult
+
+    @functools.lru_cache(maxsize=256)
     def offset(self, lines: int, max_line: int) -> Tuple[int, int]:
         """Return the offset required to position the given <lines> with a given <max_line> in the correct
         positioning for the anchor.
+
+        The computation is pure and the input space is tiny (9 anchors by small message dimensions), so results
+        are memoized to keep repeated repositioning of the same message out of the render path.
         """
-        y_offset = -int(lines * self.value[0] / 2)
-        x_offset = -int(max_line * self.value[1] / 2)
+        y_offset = -int(lines * self.__y_mult / 2)
+        x_offset = -int(max_line * self.__x_mult / 2)
         return y_offset, x_offset
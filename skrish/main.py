@@ -12,7 +12,6 @@ def main():
 
     # Initialize interface
     with cli.Interface(game) as interface:
-        interface = interface.instance
         interface.start()
         interface.call_scene("intro")
 